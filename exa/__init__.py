@@ -9,10 +9,14 @@ import os
 import tempfile
 import logging.config
 import yaml
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
 
 with open(os.path.join(os.path.dirname(__file__),
           'conf', 'logging.yml'), 'r') as f:
-    _log = yaml.safe_load(f.read())
+    _log = yaml.load(f, Loader=_SafeLoader)
 _log['handlers']['file']['filename'] = os.path.join(tempfile.gettempdir(),
                                                     'exa.log')
 logging.config.dictConfig(_log)
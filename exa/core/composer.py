@@ -108,7 +108,6 @@ class Composer(Editor):
                 cline = cline.replace(search, "{"+name+"}")
             modtmpl.append(cline)
         modtmpl = "\n".join(modtmpl)
-        print(modtmpl)
         dct = self.get_kwargs()
         dct.update(fkwargs)
         return self._constructor(textobj=modtmpl.format(*self.args, **dct))
@@ -208,7 +208,10 @@ class DataFrame(BaseDataFrame, pd.DataFrame):
         """
         for column, _ in self._categories.items():
             if column in self.columns:
-                self[column] = self[column].astype('category')
+                if isinstance(self[column].dtype, pd.api.types.CategoricalDtype):
+                    continue
+                codes, categories = pd.factorize(self[column], sort=True)
+                self[column] = pd.Categorical.from_codes(codes, categories=categories)
 
     def __init__(self, *args, **kwargs):
         super(DataFrame, self).__init__(*args, **kwargs)
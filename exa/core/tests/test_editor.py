@@ -11,14 +11,17 @@ from exa import Editor
 
 
 class TestEditor(TestCase):
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         """
         Generate the file path to the exa.core.editor module (which will be used as
         the test for the :class:`~exa.core.editor.Editor` class that it provides).
         """
-        self.path = os.path.abspath(os.path.join(os.path.abspath(__file__), "../../editor.py"))
-        with open(self.path) as f:
-            self.lines = f.readlines()
+        cls.path = os.path.abspath(os.path.join(os.path.abspath(__file__), "../../editor.py"))
+        with open(cls.path) as f:
+            cls.lines = f.readlines()
+
+    def setUp(self):
         self.fl = Editor.from_file(self.path)
 
     def test_loaders(self):
@@ -16,4 +16,6 @@ def test_static_dir():
 
 def test_resource():
     assert os.path.exists(static.resource("units.json.bz2"))
+    assert static.resource("isotopes.json").endswith("isotopes.json")
+    assert static.resource("no-such-resource.txt") is None
 
@@ -39,9 +39,11 @@ triggering function calls before and after get, set, and delete, and attempts
 automatic conversion (as shown above) for all types supported for a given
 attribute.
 """
+import sys
 import six
 import pandas as pd
 import warnings
+from operator import methodcaller
 
 
 def _typed_from_items(items):
@@ -59,6 +61,21 @@ def _typed_from_items(items):
     return dct
 
 
+def _resolve_hook(hook):
+    """
+    Convert a hook given as a method name or a callable into a callable that
+    accepts the instance (or None if there is no hook).
+
+    See Also:
+        :class:`~exa.typed.Typed`
+    """
+    if isinstance(hook, str):
+        return methodcaller(hook)
+    elif callable(hook):
+        return hook
+    return None
+
+
 def typed(cls):
     """
     Class decorator that updates a class definition with strongly typed
@@ -157,6 +174,13 @@ class Typed(object):
             prop (property): Custom property definition with support for typing
         """
         priv = "_" + name    # Reference to the variable's value
+        # Hooks are resolved once here rather than on every get/set/delete
+        pre_get = _resolve_hook(self.pre_get)
+        pre_set = _resolve_hook(self.pre_set)
+        post_set = _resolve_hook(self.post_set)
+        pre_del = _resolve_hook(self.pre_del)
+        post_del = _resolve_hook(self.post_del)
+        setter_names = {}    # Automatic setter method names keyed by _setters
 
         # The following is a definition of a Python property. Properties have
         # get, set, and delete functions as well as documentation. The variable
@@ -166,19 +190,22 @@ class Typed(object):
             # If the variable value (reference by priv) does not exist
             # or is None AND the class has some automatic way of setting the value,
             # set the value first then proceed to getting it.
-            if ((not hasattr(this, priv) or getattr(this, priv) is None) and
-                hasattr(this, "_setters") and isinstance(this._setters, (list, tuple))):
-                for prefix in this._setters:
-                    cmd = "{}{}".format(prefix, priv)
-                    if hasattr(this, cmd):
-                        getattr(this, cmd)()    # Automatic method call
+            setters = getattr(this, "_setters", None)
+            if getattr(this, priv, None) is None and isinstance(setters, (list, tuple)):
+                setters = tuple(setters)
+                cmds = setter_names.get(setters)
+                if cmds is None:
+                    cmds = tuple(sys.intern(prefix + priv) for prefix in setters)
+                    setter_names[setters] = cmds
+                for cmd in cmds:
+                    method = getattr(this, cmd, None)
+                    if method is not None:
+                        method()    # Automatic method call
                         if hasattr(this, priv):
                             break
             # Perform pre-get actions (if any)
-            if isinstance(self.pre_get, str):
-                getattr(this, self.pre_get)()
-            elif callable(self.pre_get):
-                self.pre_get(this)
+            if pre_get is not None:
+                pre_get(this)
             return getattr(this, priv, None)    # Returns None by default
 
         def setter(this, value):
@@ -201,32 +228,24 @@ class Typed(object):
                   (not isinstance(value, self.types) and value is not None)):
                 raise TypeError("Object '{}' cannot have type {}, must be of type(s) {}.".format(name, type(value), self.types))
             # Perform pre-set actions (if any)
-            if isinstance(self.pre_set, str):
-                getattr(this, self.pre_set)()
-            elif callable(self.pre_set):
-                self.pre_set(this)
+            if pre_set is not None:
+                pre_set(this)
             if isinstance(this, (pd.DataFrame, pd.SparseDataFrame)):
                 this[priv] = value
             else:
                 setattr(this, priv, value)    # Set the property value
             # Perform post-set actions (if any)
-            if isinstance(self.post_set, str):
-                getattr(this, self.post_set)()
-            elif callable(self.post_set):
-                self.post_set(this)
+            if post_set is not None:
+                post_set(this)
 
         def deleter(this):
             # Perform pre-del actions (if any)
-            if isinstance(self.pre_del, str):
-                getattr(this, self.pre_del)()
-            elif callable(self.pre_del):
-                self.pre_del(this)
+            if pre_del is not None:
+                pre_del(this)
             delattr(this, priv)    # Delete the attribute (allows for dynamic naming)
             # Perform post-del actions (if any)
-            if isinstance(self.post_del, str):
-                getattr(this, self.post_del)()
-            elif callable(self.post_del):
-                self.post_del(this)
+            if post_del is not None:
+                post_del(this)
 
         return property(getter, setter, deleter, doc=self.doc)
 
@@ -18,9 +18,11 @@ for each value.
 .. _NIST: https://www.nist.gov/
 """
 import sys as _sys
-import json as _json
-from exa import Editor as _Editor
 from exa.static import resource as _resource
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
 
 
 class Constant(float):
@@ -48,8 +50,9 @@ class Constant(float):
 
 
 def _create():
-    for kwargs in _json.load(_Editor(_path).to_stream()):
-        setattr(_this, kwargs['name'], Constant(**kwargs))
+    with open(_path, "rb") as f:
+        for kwargs in _json.loads(f.read()):
+            setattr(_this, kwargs['name'], Constant(**kwargs))
 
 _this = _sys.modules[__name__]
 _path = _resource("constants.json")
@@ -39,8 +39,10 @@ Warning:
 import os as _os
 import sys as _sys
 import bz2 as _bz2
+import numpy as _np
 from pandas import read_json as _rj
-from exa import Editor as _E
+from pandas import factorize as _factorize
+from pandas import Series as _Series
 from exa import DataFrame as _DF
 if not hasattr(_bz2, "open"):
     _bz2.open = _bz2.BZ2File
@@ -75,9 +77,7 @@ class Element(object):
         self.color = color
 
     def __getitem__(self, key):
-        if isinstance(key, str):
-            return getattr(self, "_"+key)
-        return getattr(self, key)
+        return getattr(self, "_"+str(key))
 
     def __repr__(self):
         return self.symbol
@@ -92,6 +92,9 @@ class Isotope(object):
         from exa.util import isotopes
         isotopes.U['235'].mass    # Mass of 235-U
     """
+    __slots__ = ("A", "Z", "af", "afu", "cov_radius", "van_radius", "g", "mass",
+                 "massu", "name", "eneg", "quad", "spin", "symbol", "color")
+
     @property
     def radius(self):
         return self.cov_radius
@@ -124,16 +127,10 @@ class Isotope(object):
 def _create():
     """Globally called function for creating the isotope/element API."""
     def creator(group):
-        """Helper function applied to each symbol group of the raw isotope table."""
+        """Helper function applied to each element (Z) group of the raw isotope table."""
         symbol = group['symbol'].values[0]
-        try:    # Ghosts and custom atoms don't necessarily have an abundance fraction
-            mass = (group['mass']*group['af']).sum()
-            afm = group['af'].sum()
-            if afm > 0.0:
-                mass /= afm
-        except ZeroDivisionError:
-            mass = group['mass'].mean()
         znum = group['Z'].max()
+        mass = masses.loc[znum]
         cov_radius = group['cov_radius'].mean()
         van_radius = group['van_radius'].mean()
         try:
@@ -147,22 +144,27 @@ def _create():
             setattr(ele, "_"+str(tope.A), tope)
         return ele
 
-    iso = _rj(_E(_path).to_stream())
+    iso = _rj(_path)
     iso.columns = _columns
     setattr(_this, "iso", iso)
-    for element in iso.groupby("symbol").apply(creator):
+    # Abundance weighted isotope masses (computed once for all isotopes)
+    fmass = _np.empty(len(iso), dtype=_np.float64)
+    _np.multiply(iso['mass'].values, iso['af'].values, out=fmass)
+    # Element masses as a segmented sum over each element's isotopes; ghosts
+    # and custom atoms don't necessarily have an abundance fraction
+    codes, znums = _factorize(iso['Z'].values, sort=False)
+    fmass[_np.isnan(fmass)] = 0.0
+    masses = _np.bincount(codes, weights=fmass)
+    afm = _np.bincount(codes, weights=_np.nan_to_num(iso['af'].values))
+    _np.divide(masses, afm, out=masses, where=afm > 0.0)
+    masses = _Series(masses, index=znums)    # Element masses by proton number
+    for element in iso.groupby("Z", sort=False).apply(creator):
         setattr(_this, element.symbol, element)
 
 
 def as_df():
     """Return a dataframe of isotopes."""
-    records = []
-    for sym, ele in vars(_this).items():
-        if sym not in ["Element", "Isotope"] and not sym.startswith("_"):
-            for k, v in vars(ele).items():
-                if k.startswith("_") and k[1].isdigit():
-                    records.append({kk: vv for kk, vv in vars(v).items() if not kk.startswith("_")})
-    return _DF.from_records(records)
+    return _DF(iso.copy())
 
 
 # Data order of isotopic (nuclear) properties:
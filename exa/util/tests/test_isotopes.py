@@ -30,4 +30,5 @@ class TestIsotopes(TestCase):
         self.assertEqual(isotopes.H['1'].A, 1)
         self.assertGreater(isotopes.H['1'].mass, 1.007)
         self.assertGreater(isotopes.H['1'].radius, 0.6)
+        self.assertIs(isotopes.H[2], isotopes.H['2'])
 
@@ -25,3 +25,20 @@ def test_units():
     assert np.isclose(units.Length['au', 'Angstrom'], 0.52918)
     assert np.isclose(units.Length['Angstrom'], 1E-10)
 
+
+
+def test_setitem():
+    """Check that values and conversions stay consistent."""
+    unit = units.Unit({"a": 1.0, "b": 2.0, "c": 4.0}, "test")
+    assert np.isclose(unit["b"], 0.5)
+    assert np.isclose(unit["a", "c"], 4.0)
+    unit.values["c"] = 8.0    # A copy; does not change the unit
+    assert np.isclose(unit["a", "c"], 4.0)
+    assert np.isclose(unit.values["c"], 4.0)
+    unit["c"] = 8.0
+    assert np.isclose(unit["a", "c"], 8.0)
+    assert np.isclose(unit.values["c"], 8.0)
+    unit["a"] = 0.5           # Moves the base unit to b
+    unit["b"] = 1.0
+    assert np.isclose(unit["a"], 2.0)
+    assert np.isclose(unit.values["a"], 0.5)
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2015-2019, Exa Analytics Development Team
+# Distributed under the terms of the Apache License 2.0
+"""
+Tests for :mod:`~exa.util.utility`
+#############################################
+"""
+import os
+import sys
+from exa.util import utility
+
+
+def test_convert_bytes():
+    """Test :func:`~exa.util.utility.convert_bytes`."""
+    assert utility.convert_bytes(0) == (0, "B")
+    assert utility.convert_bytes(0.5) == (0.5, "B")
+    assert utility.convert_bytes(1536.5) == (1536.5/1024, "KiB")
+    assert utility.convert_bytes(1023) == (1023, "B")
+    assert utility.convert_bytes(1024) == (1, "KiB")
+    assert utility.convert_bytes(3*1024**3) == (3, "GiB")
+    assert utility.convert_bytes(1024**8)[1] == "EiB"
+
+
+def test_internal_modules():
+    """Test :func:`~exa.util.utility.get_internal_modules`."""
+    modules = utility.get_internal_modules()
+    assert utility in modules
+    assert all(mod.__name__.startswith("exa.") for mod in modules)
+    n = len(modules)
+    sys.modules["exa._dummy_a"] = sys
+    try:
+        assert sys in utility.get_internal_modules()
+        assert len(utility.get_internal_modules()) == n + 1
+        # Remove one module and add another (same number of modules)
+        del sys.modules["exa._dummy_a"]
+        sys.modules["exa._dummy_b"] = os
+        modules = utility.get_internal_modules()
+        assert sys not in modules
+        assert os in modules
+        assert len(modules) == n + 1
+    finally:
+        sys.modules.pop("exa._dummy_a", None)
+        sys.modules.pop("exa._dummy_b", None)
+
+
+def test_datetime_header():
+    """Test :func:`~exa.util.utility.datetime_header`."""
+    header = utility.datetime_header("title").splitlines()
+    assert len(header) == 3
+    assert header[0] == header[2] == "=" * 80
+    assert header[1].startswith("title: ")
+
+
+def test_mkp(tmpdir):
+    """Test :func:`~exa.util.utility.mkp`."""
+    root = str(tmpdir)
+    assert utility.mkp("a", "b") == "a" + os.sep + "b"
+    path = utility.mkp(root, "", "c", mk=True)
+    assert path == os.path.join(root, "c")
+    assert os.path.isdir(path)
+    assert utility.mkp(root, "c", mk=True) == path
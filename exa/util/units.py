@@ -16,33 +16,55 @@ see the example below.
     Energy["eV", "Ha"]   # Conversion factor between eV and Ha (Hartree atomic unit)
 """
 import bz2 as _bz2
-import json as _json
 import os as _os
 import sys as _sys
 import six as _six
 import numpy as _np
 import pandas as _pd
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
 if not hasattr(_bz2, "open"):
     _bz2.open = _bz2.BZ2File
 
 
 class Unit(object):
+    """
+    Conversion factors for a given physical quantity.
+
+    Note:
+        Bulk operations should use the :attr:`~exa.util.units.Unit.values`
+        series; scalar lookups (i.e. ``Energy["eV", "Ha"]``) are served from
+        a plain dictionary. Values are changed via item assignment (i.e.
+        ``Energy["eV"] = value``).
+    """
     @property
     def values(self):
-        return self._values
+        """Copy of the unit values (modifying it does not change the unit)."""
+        return self._values.copy()
 
     def __setitem__(self, key, value):
         self._values[key] = value
+        self._lookup[key] = value
+        self._base = None
 
     def __getitem__(self, key):
         if isinstance(key, _six.string_types):
-            k = self._values[_np.isclose(self._values, 1.0)].index[0]
-            return self._values[k]/self._values[key]
+            if self._base is None:
+                self._base = self._get_base()
+            return self._lookup[self._base]/self._lookup[key]
         elif isinstance(key, (list, tuple)):
-            return self._values[key[1]]/self._values[key[0]]
+            return self._lookup[key[1]]/self._lookup[key[0]]
+
+    def _get_base(self):
+        """Get the name of the base (SI) unit."""
+        return self._values[_np.isclose(self._values, 1.0)].index[0]
 
     def __init__(self, values, name):
         self._values = _pd.Series(values)
+        self._lookup = self._values.to_dict()
+        self._base = None    # Name of the base unit (found on first use)
         self._name = name
 
 
@@ -53,7 +75,7 @@ def _create():
         return Unit(data, name)
 
     with _bz2.open(_path, "rb") as f:
-        dct = _json.loads(f.read().decode("utf-8"))
+        dct = _json.loads(f.read())
     for name, data in dct.items():
         setattr(_this, name.title(), creator(name, data))
 
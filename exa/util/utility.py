@@ -8,11 +8,11 @@ Commonly used functions (primarily for convenience and repetition reduction).
 """
 import os
 import sys
-import numpy as np
+import time
 from datetime import datetime
+from functools import lru_cache
 
 
-sep2 = os.sep + os.sep
 sizes = ['B', 'KiB', 'MiB', 'GiB', 'TiB', 'PiB', 'EiB']
 
 
@@ -20,11 +20,22 @@ def datetime_header(title=''):
     """
     Creates a simple header string containing the current date/time stamp
     delimited using "=".
+
+    Note:
+        The time stamp has a resolution of one second; headers created within
+        the same second are reused.
     """
-    return '\n'.join(('=' * 80, title + ': ' + str(datetime.now()), '=' * 80))
+    return _datetime_header(title, int(time.time()))
+
+
+@lru_cache(maxsize=1)
+def _datetime_header(title, seconds):
+    """Cached header construction (see :func:`~exa.util.utility.datetime_header`)."""
+    stamp = str(datetime.fromtimestamp(seconds))
+    return '\n'.join(('=' * 80, title + ': ' + stamp, '=' * 80))
 
 
-def mkp(*args, **kwargs):
+def mkp(*args, mk=False):
     """
     Generate a directory path, and create it if requested.
 
@@ -40,15 +51,10 @@ def mkp(*args, **kwargs):
     Returns:
         path (str): File or directory path
     """
-    mk = kwargs.pop('mk', False)
-    path = os.sep.join(list(args))
+    path = os.sep.join(args)
     if mk:
-        while sep2 in path:
-            path = path.replace(sep2, os.sep)
-        try:
-            os.makedirs(path)
-        except FileExistsError:
-            pass
+        path = os.path.normpath(path)
+        os.makedirs(path, exist_ok=True)
     return path
 
 
@@ -62,7 +68,9 @@ def convert_bytes(value):
     Returns:
         tup (tuple): Tuple of value, unit (e.g. (10, 'MiB'))
     """
-    n = np.rint(len(str(value))/4).astype(int)
+    if value < 1024:
+        return value, sizes[0]
+    n = min((int(value).bit_length() - 1)//10, len(sizes) - 1)
     return value/(1024**n), sizes[n]
 
 
@@ -1,5 +1,5 @@
 #!/usr/bin/env python
-from setuptools import setup, find_packages
+from setuptools import setup
 import versioneer
 
 
@@ -8,12 +8,10 @@ DESCRIPTION = "A framework for data engineering and science"
 staticdir = "static"
 README = "README.md"
 REQUIREMENTS = "requirements.txt"
-try:
-    import pypandoc
-    LONG_DESCRIPTION = pypandoc.convert(README, "rst")
-except ImportError:
-    with open(README) as f:
-        LONG_DESCRIPTION = f.read()
+PACKAGES = ["exa", "exa.core", "exa.core.tests", "exa.tests", "exa.util",
+            "exa.util.tests"]
+with open(README) as f:
+    LONG_DESCRIPTION = f.read()
 with open(REQUIREMENTS) as f:
     DEPENDENCIES = f.read().splitlines()
 
@@ -24,10 +22,11 @@ setup(
     cmdclass=versioneer.get_cmdclass(),
     description=DESCRIPTION,
     long_description=LONG_DESCRIPTION,
+    long_description_content_type="text/markdown",
     package_data={NAME: [staticdir + "/*"]},
     include_package_data=True,
     install_requires=DEPENDENCIES,
-    packages=find_packages(),
+    packages=PACKAGES,
     zip_safe=False,
     license="Apache License Version 2.0",
     author="The Exa Analytics development team",